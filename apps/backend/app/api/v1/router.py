@@ -9,6 +9,7 @@ from fastapi import APIRouter
 from app.api.v1.routes.auth import router as auth_router
 from app.api.v1.routes.upload import router as upload_router
 from app.api.v1.routes.database import router as database_router
+from app.api.v1.routes.processors import router as processors_router
 
 api_router = APIRouter()
 
@@ -16,6 +17,7 @@ api_router = APIRouter()
 api_router.include_router(auth_router, prefix="/auth", tags=["authentication"])
 api_router.include_router(upload_router, prefix="/upload", tags=["upload"])
 api_router.include_router(database_router, prefix="/db", tags=["database"])
+api_router.include_router(processors_router, prefix="/processors", tags=["processors"])
 
 @api_router.get("/")
 async def api_root():
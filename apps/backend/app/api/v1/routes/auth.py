@@ -37,7 +37,7 @@ async def signup(
             password=user_data.password,
             full_name=user_data.full_name
         )
-        return UserResponse.from_orm(user)
+        return UserResponse.model_validate(user)
     
     except HTTPException:
         raise
@@ -157,7 +157,7 @@ async def get_current_user_info(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     
-    return UserResponse.from_orm(user)
+    return UserResponse.model_validate(user)
 
 
 @router.post("/logout")
@@ -1,7 +1,8 @@
 """Common database utilities and endpoints."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from app.core.database import DatabaseManager
 from app.services.database_api import DatabaseAPIService
 from app.services.permissions import PermissionManager
@@ -10,6 +11,9 @@ from app.schemas.database import AuditLogEntry
 
 router = APIRouter(prefix="/common", tags=["database-common"])
 
+# Serializes a whole page of audit logs in one call instead of per entry
+audit_log_list_adapter = TypeAdapter(List[AuditLogEntry])
+
 
 # Shared dependency functions
 async def get_database_manager() -> DatabaseManager:
@@ -52,7 +56,7 @@ async def get_audit_logs(
         
         return {
             "success": True,
-            "logs": [log.dict() for log in logs],
+            "logs": audit_log_list_adapter.dump_python(logs),
             "count": len(logs)
         }
         
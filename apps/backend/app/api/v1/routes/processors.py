@@ -0,0 +1,65 @@
+"""
+Processor and pipeline routes for Brain_Net Backend
+"""
+
+from typing import Dict, List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.shared.models import (
+    User, UserProcessorRead, UserPipelineRead, PipelineExecutionRead, UserProcessorList, UserPipelineList
+)
+from app.services.pipeline import PipelineService
+from app.api.v1.routes.upload import get_db, get_current_user_dep
+
+router = APIRouter()
+
+
+async def get_pipeline_service(db: AsyncSession = Depends(get_db)) -> PipelineService:
+    """Dependency to get pipeline service with database session."""
+    return PipelineService(db)
+
+
+@router.get("/search", response_model=UserProcessorList)
+async def search_processors(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user_dep),
+    pipeline_service: PipelineService = Depends(get_pipeline_service)
+) -> UserProcessorList:
+    """Full-text search the current user's processors, best matches first."""
+    processors = await pipeline_service.search_processors(current_user.id, q, limit)
+    return UserProcessorList(
+        processors=[UserProcessorRead.model_validate(processor) for processor in processors],
+        total_count=len(processors)
+    )
+
+
+@router.get("/pipelines/search", response_model=UserPipelineList)
+async def search_pipelines(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user_dep),
+    pipeline_service: PipelineService = Depends(get_pipeline_service)
+) -> UserPipelineList:
+    """Full-text search the current user's pipelines, best matches first."""
+    pipelines = await pipeline_service.search_pipelines(current_user.id, q, limit)
+    return UserPipelineList(
+        pipelines=[UserPipelineRead.model_validate(pipeline) for pipeline in pipelines],
+        total_count=len(pipelines)
+    )
+
+
+@router.get("/pipelines/executions/recent", response_model=Dict[int, List[PipelineExecutionRead]])
+async def list_recent_executions(
+    pipeline_ids: List[int] = Query(...),
+    limit: int = Query(5, ge=1, le=50),
+    current_user: User = Depends(get_current_user_dep),
+    pipeline_service: PipelineService = Depends(get_pipeline_service)
+) -> Dict[int, List[PipelineExecutionRead]]:
+    """Get the most recent executions of several pipelines, keyed by pipeline id."""
+    recent = await pipeline_service.load_recent_executions(current_user.id, pipeline_ids, limit)
+    return {
+        pipeline_id: [PipelineExecutionRead.model_validate(execution) for execution in executions]
+        for pipeline_id, executions in recent.items()
+    }
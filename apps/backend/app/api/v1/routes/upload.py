@@ -158,19 +158,20 @@ async def download_file(
 ):
     """Download a file by its hash (user must own the file)."""
     try:
-        file_stream = await file_service.get_user_file_stream(current_user.id, file_hash)
-        file_info = await file_service.get_user_file_info(current_user.id, file_hash)
-        
-        if not file_info:
+        # Look the file up once and reuse the row for both the stream and the headers
+        user_file = await file_service.check_user_file_exists(current_user.id, file_hash)
+        if not user_file:
             raise HTTPException(status_code=404, detail="File not found or you don't have access to it")
         
+        file_stream = await file_service.open_user_file_stream(user_file)
+        
         from fastapi.responses import StreamingResponse
         
         return StreamingResponse(
             file_stream,
-            media_type=file_info.get("content_type", "application/octet-stream"),
+            media_type=user_file.content_type or "application/octet-stream",
             headers={
-                "Content-Disposition": f"attachment; filename={file_info.get('original_filename', file_hash)}"
+                "Content-Disposition": f"attachment; filename={user_file.original_filename or file_hash}"
             }
         )
     except HTTPException:
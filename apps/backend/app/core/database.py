@@ -65,17 +65,22 @@ class DatabaseManager(LoggerMixin):
             ("redis", self._init_redis())
         ]
         
-        for service_name, init_task in optional_init_tasks:
-            try:
-                await init_task
+        # Services are independent, so connect to them concurrently
+        init_results = await asyncio.gather(
+            *(init_task for _, init_task in optional_init_tasks),
+            return_exceptions=True
+        )
+        
+        # CancelledError comes back as a BaseException result, so treat any BaseException as a failure
+        for (service_name, _), error in zip(optional_init_tasks, init_results):
+            if not isinstance(error, BaseException):
                 self.logger.info(f"{service_name.capitalize()} initialized successfully")
-            except Exception as e:
-                if service_name in settings.REQUIRED_SERVICES:
-                    self.logger.error(f"Failed to initialize required service {service_name}: {str(e)}")
-                    required_failures.append((service_name, str(e)))
-                else:
-                    self.logger.warning(f"Failed to initialize optional service {service_name}: {str(e)}")
-                    self._failed_services.add(service_name)
+            elif service_name in settings.REQUIRED_SERVICES:
+                self.logger.error(f"Failed to initialize required service {service_name}: {str(error)}")
+                required_failures.append((service_name, str(error)))
+            else:
+                self.logger.warning(f"Failed to initialize optional service {service_name}: {str(error)}")
+                self._failed_services.add(service_name)
         
         # Check if we have any required service failures
         if required_failures:
@@ -102,6 +107,8 @@ class DatabaseManager(LoggerMixin):
                 settings.get_database_url(async_driver=True),
                 pool_size=settings.DATABASE_POOL_SIZE,
                 max_overflow=settings.DATABASE_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                pool_recycle=settings.DATABASE_POOL_RECYCLE,
                 echo=settings.DEBUG_SQL,
                 future=True
             )
@@ -2,6 +2,7 @@
 Database API service for secure database operations via HTTP endpoints.
 """
 
+import re
 import time
 import uuid
 import json
@@ -20,6 +21,14 @@ from app.schemas.database import (
 )
 
 
+# PostgreSQL statement keywords reported as operations; all are six letters long
+POSTGRES_OPERATIONS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE'})
+
+# Neo4j clauses reported as operations, in order of precedence
+NEO4J_OPERATIONS = ('MATCH', 'CREATE', 'MERGE', 'DELETE')
+NEO4J_OPERATION_PATTERN = re.compile('|'.join(NEO4J_OPERATIONS), re.IGNORECASE)
+
+
 class DatabaseAPIService(LoggerMixin):
     """Service for handling database operations with authorization and auditing."""
     
@@ -33,7 +42,7 @@ class DatabaseAPIService(LoggerMixin):
         """Execute PostgreSQL query with full authorization and auditing."""
         
         operation_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Create execution context if not provided
         if execution_context is None:
@@ -75,7 +84,7 @@ class DatabaseAPIService(LoggerMixin):
                     columns = []
                     rows = []
                 
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 
                 # 5. Audit logging
                 await self.audit_logger.log_database_operation(
@@ -100,7 +109,7 @@ class DatabaseAPIService(LoggerMixin):
                 )
                 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = str(e)
             
             # Error logging
@@ -125,7 +134,7 @@ class DatabaseAPIService(LoggerMixin):
         """Execute Elasticsearch search with user context."""
         
         operation_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if execution_context is None:
             execution_context = ExecutionContext(
@@ -162,7 +171,7 @@ class DatabaseAPIService(LoggerMixin):
                 }
             )
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # 5. Audit logging
             await self.audit_logger.log_database_operation(
@@ -187,7 +196,7 @@ class DatabaseAPIService(LoggerMixin):
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = str(e)
             
             await self.audit_logger.log_database_operation(
@@ -211,7 +220,7 @@ class DatabaseAPIService(LoggerMixin):
         """Execute Neo4j query with user context."""
         
         operation_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if execution_context is None:
             execution_context = ExecutionContext(
@@ -241,7 +250,7 @@ class DatabaseAPIService(LoggerMixin):
                 records = [record.data() for record in await result.data()]
                 summary = await result.consume()
                 
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 
                 # 4. Audit logging
                 await self.audit_logger.log_database_operation(
@@ -270,7 +279,7 @@ class DatabaseAPIService(LoggerMixin):
                 )
                 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = str(e)
             
             await self.audit_logger.log_database_operation(
@@ -293,7 +302,7 @@ class DatabaseAPIService(LoggerMixin):
         """Execute Redis command with user context."""
         
         operation_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if execution_context is None:
             execution_context = ExecutionContext(
@@ -321,7 +330,7 @@ class DatabaseAPIService(LoggerMixin):
             redis_client = self.db_manager.redis
             result = await redis_client.execute_command(command, *contextualized_args)
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # 4. Audit logging
             await self.audit_logger.log_database_operation(
@@ -345,7 +354,7 @@ class DatabaseAPIService(LoggerMixin):
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = str(e)
             
             await self.audit_logger.log_database_operation(
@@ -366,31 +375,20 @@ class DatabaseAPIService(LoggerMixin):
     # Helper methods
     def _extract_postgres_operation(self, query: str) -> str:
         """Extract operation type from PostgreSQL query."""
-        query_upper = query.strip().upper()
-        if query_upper.startswith('SELECT'):
-            return 'SELECT'
-        elif query_upper.startswith('INSERT'):
-            return 'INSERT'
-        elif query_upper.startswith('UPDATE'):
-            return 'UPDATE'
-        elif query_upper.startswith('DELETE'):
-            return 'DELETE'
-        else:
-            return 'UNKNOWN'
+        # Only the leading keyword matters, so avoid upper-casing the whole query
+        operation = query.lstrip()[:6].upper()
+        return operation if operation in POSTGRES_OPERATIONS else 'UNKNOWN'
     
     def _extract_neo4j_operation(self, query: str) -> str:
         """Extract operation type from Neo4j query."""
-        query_upper = query.strip().upper()
-        if 'MATCH' in query_upper:
-            return 'MATCH'
-        elif 'CREATE' in query_upper:
-            return 'CREATE'
-        elif 'MERGE' in query_upper:
-            return 'MERGE'
-        elif 'DELETE' in query_upper:
-            return 'DELETE'
-        else:
-            return 'UNKNOWN'
+        # Scan the query once and then pick the highest-precedence clause found
+        found = set()
+        for match in NEO4J_OPERATION_PATTERN.finditer(query):
+            operation = match.group().upper()
+            if operation == NEO4J_OPERATIONS[0]:
+                return operation
+            found.add(operation)
+        return next((operation for operation in NEO4J_OPERATIONS if operation in found), 'UNKNOWN')
     
     def _add_user_context_to_params(self, params: Dict[str, Any], user_id: int) -> Dict[str, Any]:
         """Add user context to query parameters."""
@@ -438,17 +436,15 @@ class DatabaseAPIService(LoggerMixin):
             return args
         
         # For Redis, we typically need to prefix keys with user context
-        contextualized_args = []
-        for i, arg in enumerate(args):
-            if i == 0 and isinstance(arg, str):  # First argument is usually the key
-                if not arg.startswith(f'user:{user_id}:') and not arg.startswith('public:'):
-                    contextualized_args.append(f'user:{user_id}:{arg}')
-                else:
-                    contextualized_args.append(arg)
-            else:
-                contextualized_args.append(arg)
+        key = args[0]
+        if not isinstance(key, str):  # First argument is usually the key
+            return list(args)
+        
+        user_prefix = f'user:{user_id}:'
+        if not key.startswith((user_prefix, 'public:')):
+            key = user_prefix + key
         
-        return contextualized_args
+        return [key, *args[1:]]
 
 
 class AuditLogger(LoggerMixin):
@@ -540,9 +536,10 @@ class AuditLogger(LoggerMixin):
                     {"user_id": user_id, "limit": limit}
                 )
                 
+                # Rows come from our own audit table, so skip re-validating every field
                 logs = []
                 for row in result.fetchall():
-                    logs.append(AuditLogEntry(
+                    logs.append(AuditLogEntry.model_construct(
                         id=row.id,
                         user_id=row.user_id,
                         execution_id=row.execution_id,
@@ -5,21 +5,52 @@ Handles file uploads to MinIO with user isolation and database tracking.
 
 import hashlib
 import asyncio
+import io
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from minio import Minio
 from minio.error import S3Error
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import aiofiles
-import tempfile
-import os
+from sqlalchemy import func, select
 from datetime import datetime
 
 from app.core.config import get_settings
+from app.core.logging import get_logger
 from apps.shared.models import User, UserFile
+from apps.shared.schemas.upload import user_file_list_adapter
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+
+@lru_cache()
+def get_minio_client() -> Minio:
+    """Get the process-wide MinIO client."""
+    return Minio(
+        settings.MINIO_ENDPOINT,
+        access_key=settings.MINIO_ACCESS_KEY,
+        secret_key=settings.MINIO_SECRET_KEY,
+        secure=settings.MINIO_SECURE
+    )
+
+
+# Set once the bucket is known to exist; until then every service init re-checks
+_bucket_ready = False
+
+
+def ensure_bucket_exists(client: Minio) -> None:
+    """Ensure the upload bucket exists, create if it doesn't."""
+    global _bucket_ready
+    if _bucket_ready:
+        return
+    
+    try:
+        if not client.bucket_exists(settings.MINIO_BUCKET_NAME):
+            client.make_bucket(settings.MINIO_BUCKET_NAME)
+        _bucket_ready = True
+    except S3Error as e:
+        logger.error(f"Error creating bucket: {e}")
 
 
 class FileUploadService:
@@ -27,45 +58,22 @@ class FileUploadService:
     
     def __init__(self, db: AsyncSession):
         """Initialize MinIO client and database session."""
-        self.client = Minio(
-            settings.MINIO_ENDPOINT,
-            access_key=settings.MINIO_ACCESS_KEY,
-            secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_SECURE
-        )
+        self.client = get_minio_client()
+        ensure_bucket_exists(self.client)
         self.bucket_name = settings.MINIO_BUCKET_NAME
         self.db = db
-        self._ensure_bucket_exists()
-    
-    def _ensure_bucket_exists(self):
-        """Ensure the bucket exists, create if it doesn't."""
-        try:
-            if not self.client.bucket_exists(self.bucket_name):
-                self.client.make_bucket(self.bucket_name)
-        except S3Error as e:
-            print(f"Error creating bucket: {e}")
     
     async def calculate_file_hash(self, file: UploadFile) -> str:
         """Calculate MD5 hash of the uploaded file."""
         md5_hash = hashlib.md5()
         
-        # Save to temp file to calculate hash without consuming the stream
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Hash the upload in chunks straight from the request stream
+        while chunk := await file.read(1024 * 1024):
+            md5_hash.update(chunk)
         
         # Reset file position for later use
         await file.seek(0)
         
-        # Calculate hash from temp file
-        async with aiofiles.open(temp_file_path, 'rb') as f:
-            while chunk := await f.read(8192):
-                md5_hash.update(chunk)
-        
-        # Clean up temp file
-        os.unlink(temp_file_path)
-        
         return md5_hash.hexdigest()
     
     def _get_user_storage_path(self, user_id: int, file_hash: str) -> str:
@@ -117,17 +125,15 @@ class FileUploadService:
             file_content = await file.read()
             file_size = len(file_content)
             
-            # Upload to MinIO using user-specific path
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
-            
-            # Upload file to MinIO
+            # Upload file to MinIO straight from memory, using user-specific path
             # Note: MinIO metadata values must be ASCII-only, so we store filename in database only
-            self.client.fput_object(
+            # The MinIO client is blocking, so run it off the event loop
+            await asyncio.to_thread(
+                self.client.put_object,
                 self.bucket_name,
                 storage_path,
-                temp_file_path,
+                io.BytesIO(file_content),
+                file_size,
                 content_type=file.content_type or "application/octet-stream",
                 metadata={
                     "upload_time": datetime.utcnow().isoformat(),
@@ -136,9 +142,6 @@ class FileUploadService:
                 }
             )
             
-            # Clean up temp file
-            os.unlink(temp_file_path)
-            
             # Save file information to database
             user_file = UserFile(
                 user_id=user.id,
@@ -193,8 +196,15 @@ class FileUploadService:
                 detail="File not found or you don't have access to it"
             )
         
+        return await self.open_user_file_stream(user_file)
+    
+    async def open_user_file_stream(self, user_file: UserFile):
+        """Get file stream from MinIO for an already looked-up user file."""
         try:
-            return self.client.get_object(self.bucket_name, user_file.storage_path)
+            # Opening the object is a blocking HTTP round-trip, keep it off the event loop
+            return await asyncio.to_thread(
+                self.client.get_object, self.bucket_name, user_file.storage_path
+            )
         except S3Error as e:
             raise HTTPException(
                 status_code=404,
@@ -204,9 +214,9 @@ class FileUploadService:
     async def list_user_files(self, user_id: int, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """List all files for a specific user."""
         # Get total count
-        count_stmt = select(UserFile).where(UserFile.user_id == user_id)
+        count_stmt = select(func.count()).select_from(UserFile).where(UserFile.user_id == user_id)
         count_result = await self.db.execute(count_stmt)
-        total_count = len(count_result.scalars().all())
+        total_count = count_result.scalar_one()
         
         # Get files with pagination
         stmt = (
@@ -220,17 +230,7 @@ class FileUploadService:
         files = result.scalars().all()
         
         return {
-            "files": [
-                {
-                    "id": f.id,
-                    "file_hash": f.file_hash,
-                    "original_filename": f.original_filename,
-                    "file_size": f.file_size,
-                    "content_type": f.content_type,
-                    "uploaded_at": f.uploaded_at
-                }
-                for f in files
-            ],
+            "files": user_file_list_adapter.validate_python(files, from_attributes=True),
             "total_count": total_count
         }
 
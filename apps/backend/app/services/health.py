@@ -48,34 +48,32 @@ class HealthService(LoggerMixin):
             return_exceptions=True
         )
         
-        # Process results
+        # Calculate total check time
+        check_duration_ms = round((time.time() - start_time) * 1000, 2)
+        
+        # Process results, add metadata and count healthy services in one pass
         service_names = ["postgres", "elasticsearch", "neo4j", "minio", "redis"]
         health_status = {}
+        healthy_count = 0
         
-        for i, (service_name, result) in enumerate(zip(service_names, health_checks)):
+        for service_name, result in zip(service_names, health_checks):
             if isinstance(result, Exception):
-                health_status[service_name] = {
+                result = {
                     "healthy": False,
                     "message": f"Health check failed: {str(result)}",
                     "error": str(result),
                     "timestamp": now.isoformat() + "Z"
                 }
-            else:
-                health_status[service_name] = result
-        
-        # Calculate total check time
-        total_time = time.time() - start_time
-        
-        # Add metadata
-        for service_status in health_status.values():
-            service_status["check_duration_ms"] = round(total_time * 1000, 2)
+            result["check_duration_ms"] = check_duration_ms
+            health_status[service_name] = result
+            if result["healthy"]:
+                healthy_count += 1
         
         # Cache results
         self._last_check_time = now
         self._cached_health_status = health_status
         
         # Log summary
-        healthy_count = sum(1 for status in health_status.values() if status["healthy"])
         total_count = len(health_status)
         self.logger.info(f"Health check completed: {healthy_count}/{total_count} services healthy")
         
@@ -11,64 +11,72 @@ from app.core.logging import LoggerMixin
 from app.core.database import DatabaseManager
 
 
+# Public tables accessible to all users
+PUBLIC_TABLES = frozenset({
+    'public_documents',
+    'shared_resources',
+    'system_settings',
+    'built_in_processors'
+})
+
+# Tables that require admin access
+ADMIN_TABLES = frozenset({
+    'users',
+    'user_permissions',
+    'audit_logs',
+    'system_configuration'
+})
+
+# Dangerous SQL functions that should be blocked
+DANGEROUS_SQL_FUNCTIONS = frozenset({
+    'pg_sleep', 'pg_read_file', 'pg_ls_dir', 'pg_stat_file',
+    'copy', 'lo_import', 'lo_export', 'dblink', 'pg_exec',
+    'pg_terminate_backend', 'pg_cancel_backend'
+})
+
+# One alternation scanned once per query instead of a substring pass per function
+DANGEROUS_SQL_FUNCTIONS_PATTERN = re.compile(
+    '|'.join(re.escape(func) for func in sorted(DANGEROUS_SQL_FUNCTIONS)),
+    re.IGNORECASE
+)
+
+
 class PermissionManager(LoggerMixin):
     """Manages user permissions for database operations."""
     
+    # Allowed operations per database type, mapped to their validator methods.
+    # Built once per class instead of binding every validator per instance.
+    allowed_operations: Dict[str, Dict[str, str]] = {
+        'postgres': {
+            'SELECT': '_validate_postgres_select',
+            'INSERT': '_validate_postgres_insert',
+            'UPDATE': '_validate_postgres_update',
+            'DELETE': '_validate_postgres_delete'
+        },
+        'elasticsearch': {
+            'search': '_validate_elasticsearch_search',
+            'index': '_validate_elasticsearch_index',
+            'delete': '_validate_elasticsearch_delete'
+        },
+        'neo4j': {
+            'MATCH': '_validate_neo4j_match',
+            'CREATE': '_validate_neo4j_create',
+            'MERGE': '_validate_neo4j_merge',
+            'DELETE': '_validate_neo4j_delete'
+        },
+        'redis': {
+            'GET': '_validate_redis_get',
+            'SET': '_validate_redis_set',
+            'DEL': '_validate_redis_del',
+            'LPUSH': '_validate_redis_lpush',
+            'RPOP': '_validate_redis_rpop',
+            'HGET': '_validate_redis_hget',
+            'HSET': '_validate_redis_hset'
+        }
+    }
+    
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
-        
-        # Define allowed operations per database type
-        self.allowed_operations = {
-            'postgres': {
-                'SELECT': self._validate_postgres_select,
-                'INSERT': self._validate_postgres_insert,
-                'UPDATE': self._validate_postgres_update,
-                'DELETE': self._validate_postgres_delete
-            },
-            'elasticsearch': {
-                'search': self._validate_elasticsearch_search,
-                'index': self._validate_elasticsearch_index,
-                'delete': self._validate_elasticsearch_delete
-            },
-            'neo4j': {
-                'MATCH': self._validate_neo4j_match,
-                'CREATE': self._validate_neo4j_create,
-                'MERGE': self._validate_neo4j_merge,
-                'DELETE': self._validate_neo4j_delete
-            },
-            'redis': {
-                'GET': self._validate_redis_get,
-                'SET': self._validate_redis_set,
-                'DEL': self._validate_redis_del,
-                'LPUSH': self._validate_redis_lpush,
-                'RPOP': self._validate_redis_rpop,
-                'HGET': self._validate_redis_hget,
-                'HSET': self._validate_redis_hset
-            }
-        }
-        
-        # Public tables accessible to all users
-        self.public_tables = {
-            'public_documents',
-            'shared_resources',
-            'system_settings',
-            'built_in_processors'
-        }
-        
-        # Tables that require admin access
-        self.admin_tables = {
-            'users',
-            'user_permissions',
-            'audit_logs',
-            'system_configuration'
-        }
-        
-        # Dangerous SQL functions that should be blocked
-        self.dangerous_sql_functions = {
-            'pg_sleep', 'pg_read_file', 'pg_ls_dir', 'pg_stat_file',
-            'copy', 'lo_import', 'lo_export', 'dblink', 'pg_exec',
-            'pg_terminate_backend', 'pg_cancel_backend'
-        }
     
     async def can_execute_operation(self, user_id: int, database_type: str, 
                                   operation: str, query_or_command: str,
@@ -78,15 +86,17 @@ class PermissionManager(LoggerMixin):
         context = context or {}
         
         # Check if database type is supported
-        if database_type not in self.allowed_operations:
+        operations = self.allowed_operations.get(database_type)
+        if operations is None:
             return False, f"Database type '{database_type}' not supported"
         
         # Check if operation is allowed for this database type
-        if operation not in self.allowed_operations[database_type]:
+        validator_name = operations.get(operation)
+        if validator_name is None:
             return False, f"Operation '{operation}' not allowed for {database_type}"
         
         # Get validator function
-        validator = self.allowed_operations[database_type][operation]
+        validator = getattr(self, validator_name)
         
         # Execute validation
         try:
@@ -357,11 +367,11 @@ class PermissionManager(LoggerMixin):
         """Check if user can access PostgreSQL table."""
         
         # Public tables accessible to all users
-        if table_name in self.public_tables:
+        if table_name in PUBLIC_TABLES:
             return True
         
         # Admin tables require admin access
-        if table_name in self.admin_tables:
+        if table_name in ADMIN_TABLES:
             return await self.is_admin_user(user_id)
         
         # User-specific tables
@@ -452,5 +462,4 @@ class PermissionManager(LoggerMixin):
     def _contains_dangerous_sql_functions(self, query: str) -> bool:
         """Check for dangerous SQL functions."""
         
-        query_lower = query.lower()
-        return any(func in query_lower for func in self.dangerous_sql_functions) 
\ No newline at end of file
+        return DANGEROUS_SQL_FUNCTIONS_PATTERN.search(query) is not None 
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Pipeline service for Brain_Net Backend
+Handles reading user pipelines and their executions.
+"""
+
+from typing import Dict, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, update
+
+from apps.shared.models import UserProcessor, UserPipeline, PipelineExecution
+
+
+class PipelineService:
+    """Service for querying user pipelines and their executions."""
+    
+    def __init__(self, db: AsyncSession):
+        """Initialize with database session."""
+        self.db = db
+    
+    async def search_processors(self, user_id: int, query: str, limit: int = 20) -> List[UserProcessor]:
+        """Full-text search a user's processors by name and description, best matches first."""
+        ts_query = func.websearch_to_tsquery("english", query)
+        stmt = (
+            select(UserProcessor)
+            .where(
+                UserProcessor.user_id == user_id,
+                UserProcessor.search_vector.op("@@")(ts_query)
+            )
+            .order_by(func.ts_rank(UserProcessor.search_vector, ts_query).desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars())
+    
+    async def search_pipelines(self, user_id: int, query: str, limit: int = 20) -> List[UserPipeline]:
+        """Full-text search a user's pipelines by name and description, best matches first."""
+        ts_query = func.websearch_to_tsquery("english", query)
+        stmt = (
+            select(UserPipeline)
+            .where(
+                UserPipeline.user_id == user_id,
+                UserPipeline.search_vector.op("@@")(ts_query)
+            )
+            .order_by(func.ts_rank(UserPipeline.search_vector, ts_query).desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars())
+    
+    async def load_recent_executions(
+        self, user_id: int, pipeline_ids: List[int], limit: int = 5
+    ) -> Dict[int, List[PipelineExecution]]:
+        """Load a user's most recent executions for several pipelines in one query."""
+        recent: Dict[int, List[PipelineExecution]] = {pipeline_id: [] for pipeline_id in pipeline_ids}
+        if not recent:
+            return recent
+        
+        # Rank executions within each pipeline so only the newest `limit` rows come back;
+        # never-started rows (started_at IS NULL) rank last
+        ranked = (
+            select(
+                PipelineExecution.id,
+                func.row_number().over(
+                    partition_by=PipelineExecution.pipeline_id,
+                    order_by=PipelineExecution.started_at.desc().nulls_last()
+                ).label("rank")
+            )
+            .where(
+                PipelineExecution.user_id == user_id,
+                PipelineExecution.pipeline_id.in_(list(recent))
+            )
+            .subquery()
+        )
+        stmt = (
+            select(PipelineExecution)
+            .join(ranked, PipelineExecution.id == ranked.c.id)
+            .where(ranked.c.rank <= limit)
+            .order_by(PipelineExecution.pipeline_id, PipelineExecution.started_at.desc().nulls_last())
+        )
+        result = await self.db.execute(stmt)
+        
+        for execution in result.scalars():
+            recent[execution.pipeline_id].append(execution)
+        
+        return recent
+    
+    async def record_execution_completed(self, pipeline_id: int, execution_time: float) -> None:
+        """Fold a finished execution into the pipeline's usage statistics."""
+        # Single atomic UPDATE: the right-hand side sees the pre-update values,
+        # so concurrent completions never lose a count or rescan past executions
+        stmt = (
+            update(UserPipeline)
+            .where(UserPipeline.id == pipeline_id)
+            .values(
+                execution_count=UserPipeline.execution_count + 1,
+                sum_execution_time=UserPipeline.sum_execution_time + execution_time,
+                average_execution_time=(UserPipeline.sum_execution_time + execution_time)
+                / (UserPipeline.execution_count + 1),
+                last_executed=func.now()
+            )
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
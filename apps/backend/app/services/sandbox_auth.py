@@ -5,7 +5,7 @@ Sandbox authentication service for secure service-to-service communication.
 import jwt
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 from fastapi import HTTPException, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.config import settings
@@ -29,6 +29,8 @@ class SandboxAuthService(LoggerMixin):
         self.db_manager = db_manager
         self.permission_manager = permission_manager
         self.active_tokens = {}  # In production, use Redis
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._tokens_by_execution: Dict[str, Set[str]] = {}
         self.token_expiry_hours = 1
         
     async def create_execution_token(self, user_id: int, execution_id: str, 
@@ -65,6 +67,8 @@ class SandboxAuthService(LoggerMixin):
             "expires_at": datetime.utcnow() + timedelta(hours=self.token_expiry_hours),
             "revoked": False
         }
+        self._tokens_by_user.setdefault(user_id, set()).add(token)
+        self._tokens_by_execution.setdefault(execution_id, set()).add(token)
         
         self.logger.info(f"Created execution token for user {user_id}, execution {execution_id}")
         
@@ -91,7 +95,7 @@ class SandboxAuthService(LoggerMixin):
             expires_at = datetime.fromisoformat(payload['expires_at'])
             if datetime.utcnow() > expires_at:
                 # Remove expired token
-                del self.active_tokens[token]
+                self._remove_token(token)
                 raise HTTPException(status_code=401, detail="Token expired")
             
             # Check scope
@@ -123,8 +127,9 @@ class SandboxAuthService(LoggerMixin):
         """Revoke all tokens for a specific user."""
         
         revoked_count = 0
-        for token, token_info in self.active_tokens.items():
-            if token_info["user_id"] == user_id and not token_info.get("revoked", False):
+        for token in self._tokens_by_user.get(user_id, ()):
+            token_info = self.active_tokens[token]
+            if not token_info.get("revoked", False):
                 token_info["revoked"] = True
                 revoked_count += 1
         
@@ -135,8 +140,9 @@ class SandboxAuthService(LoggerMixin):
         """Revoke all tokens for a specific execution."""
         
         revoked_count = 0
-        for token, token_info in self.active_tokens.items():
-            if token_info["execution_id"] == execution_id and not token_info.get("revoked", False):
+        for token in self._tokens_by_execution.get(execution_id, ()):
+            token_info = self.active_tokens[token]
+            if not token_info.get("revoked", False):
                 token_info["revoked"] = True
                 revoked_count += 1
         
@@ -154,7 +160,7 @@ class SandboxAuthService(LoggerMixin):
                 expired_tokens.append(token)
         
         for token in expired_tokens:
-            del self.active_tokens[token]
+            self._remove_token(token)
         
         self.logger.info(f"Cleaned up {len(expired_tokens)} expired tokens")
         return len(expired_tokens)
@@ -169,11 +175,12 @@ class SandboxAuthService(LoggerMixin):
     async def get_user_active_tokens(self, user_id: int) -> List[Dict]:
         """Get active tokens for a specific user."""
         
+        now = datetime.utcnow()
         user_tokens = []
-        for token, token_info in self.active_tokens.items():
-            if (token_info["user_id"] == user_id and 
-                not token_info.get("revoked", False) and
-                token_info["expires_at"] > datetime.utcnow()):
+        for token in self._tokens_by_user.get(user_id, ()):
+            token_info = self.active_tokens[token]
+            if (not token_info.get("revoked", False) and
+                token_info["expires_at"] > now):
                 
                 user_tokens.append({
                     "execution_id": token_info["execution_id"],
@@ -182,6 +189,18 @@ class SandboxAuthService(LoggerMixin):
                 })
         
         return user_tokens
+    
+    def _remove_token(self, token: str) -> None:
+        """Drop a token from the store and its lookup indexes."""
+        
+        token_info = self.active_tokens.pop(token)
+        for index, key in ((self._tokens_by_user, token_info["user_id"]),
+                           (self._tokens_by_execution, token_info["execution_id"])):
+            tokens = index.get(key)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del index[key]
 
 
 class SandboxAuthMiddleware:
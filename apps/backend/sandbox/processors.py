@@ -3,7 +3,10 @@ Enhanced processor classes for sandbox environment with HTTP database access.
 """
 
 import asyncio
+import hashlib
 import json
+import random
+import time
 from typing import AsyncGenerator, Any, Dict, List, Optional
 from datetime import datetime
 from processor_pipeline import AsyncProcessor
@@ -28,6 +31,13 @@ class SandboxAsyncProcessor(AsyncProcessor):
                 'input_type': 'Any',
                 'output_type': 'Any'
             }
+        
+        # Processor identity for get_execution_metadata; the execution context
+        # can change between runs, so its fields are read on every call
+        self._processor_metadata = {
+            "processor_name": self.meta.get('name'),
+            "processor_version": self.meta.get('version')
+        }
     
     async def process(self, data: AsyncGenerator[Any, None]) -> AsyncGenerator[Any, None]:
         """
@@ -178,31 +188,40 @@ class SandboxAsyncProcessor(AsyncProcessor):
     async def create_graph_nodes(self, nodes: List[Dict[str, Any]]) -> bool:
         """Create nodes in Neo4j graph database."""
         
+        if not nodes:
+            return True
+        
         try:
-            for node in nodes:
-                query = """
-                    CREATE (n:Node {
-                        id: $id,
-                        type: $type,
-                        properties: $properties,
-                        user_id: $user_id,
-                        execution_id: $execution_id
-                    })
-                """
-                
-                params = {
-                    "id": node.get("id"),
-                    "type": node.get("type", "Default"),
-                    "properties": node.get("properties", {}),
-                    "user_id": self.execution_context.get("user_id"),
-                    "execution_id": self.execution_context.get("execution_id")
-                }
-                
-                await self.db_client.execute_neo4j_query(
-                    query=query,
-                    params=params,
-                    execution_context=self.execution_context
-                )
+            # Create all nodes in a single round trip
+            query = """
+                UNWIND $nodes AS node
+                CREATE (n:Node {
+                    id: node.id,
+                    type: node.type,
+                    properties: node.properties,
+                    user_id: $user_id,
+                    execution_id: $execution_id
+                })
+            """
+            
+            params = {
+                "nodes": [
+                    {
+                        "id": node.get("id"),
+                        "type": node.get("type", "Default"),
+                        "properties": node.get("properties", {})
+                    }
+                    for node in nodes
+                ],
+                "user_id": self.execution_context.get("user_id"),
+                "execution_id": self.execution_context.get("execution_id")
+            }
+            
+            await self.db_client.execute_neo4j_query(
+                query=query,
+                params=params,
+                execution_context=self.execution_context
+            )
             
             if self.debug_mode:
                 self.logger.info(f"Created {len(nodes)} graph nodes")
@@ -262,8 +281,7 @@ class SandboxAsyncProcessor(AsyncProcessor):
         """Get metadata about current execution."""
         
         return {
-            "processor_name": self.meta.get('name'),
-            "processor_version": self.meta.get('version'),
+            **self._processor_metadata,
             "execution_id": self.execution_context.get('execution_id'),
             "user_id": self.execution_context.get('user_id'),
             "pipeline_id": self.execution_context.get('pipeline_id'),
@@ -275,63 +293,45 @@ class SandboxAsyncProcessor(AsyncProcessor):
     async def validate_database_access(self) -> Dict[str, bool]:
         """Validate access to different database types."""
         
-        validation_results = {}
-        
-        try:
+        checks = {
             # Test PostgreSQL access
-            result = await self.db_client.validate_query(
-                database_type="postgres",
-                operation="SELECT",
-                query="SELECT 1"
-            )
-            validation_results["postgres"] = result.get("valid", False)
-        except Exception:
-            validation_results["postgres"] = False
-        
-        try:
+            "postgres": ("SELECT", "SELECT 1"),
             # Test Elasticsearch access
-            result = await self.db_client.validate_query(
-                database_type="elasticsearch",
-                operation="search",
-                query=json.dumps({"match_all": {}})
-            )
-            validation_results["elasticsearch"] = result.get("valid", False)
-        except Exception:
-            validation_results["elasticsearch"] = False
-        
-        try:
+            "elasticsearch": ("search", json.dumps({"match_all": {}})),
             # Test Neo4j access
-            result = await self.db_client.validate_query(
-                database_type="neo4j",
-                operation="MATCH",
-                query="MATCH (n) RETURN count(n) LIMIT 1"
-            )
-            validation_results["neo4j"] = result.get("valid", False)
-        except Exception:
-            validation_results["neo4j"] = False
-        
-        try:
+            "neo4j": ("MATCH", "MATCH (n) RETURN count(n) LIMIT 1"),
             # Test Redis access
-            result = await self.db_client.validate_query(
-                database_type="redis",
-                operation="GET",
-                query="PING"
-            )
-            validation_results["redis"] = result.get("valid", False)
-        except Exception:
-            validation_results["redis"] = False
+            "redis": ("GET", "PING")
+        }
+        
+        # Checks are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(
+                self.db_client.validate_query(
+                    database_type=database_type,
+                    operation=operation,
+                    query=query
+                )
+                for database_type, (operation, query) in checks.items()
+            ),
+            return_exceptions=True
+        )
         
-        return validation_results
+        return {
+            database_type: not isinstance(result, BaseException) and result.get("valid", False)
+            for database_type, result in zip(checks, results)
+        }
     
     async def log_processing_metrics(self, metrics: Dict[str, Any]) -> bool:
         """Log processing metrics to database."""
         
         try:
+            timestamp = datetime.utcnow().isoformat()
             metrics_data = {
                 **metrics,
                 "processor_name": self.meta.get('name'),
                 "execution_id": self.execution_context.get('execution_id'),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
             
             query = """
@@ -344,7 +344,7 @@ class SandboxAsyncProcessor(AsyncProcessor):
                 "processor_name": self.meta.get('name'),
                 "execution_id": self.execution_context.get('execution_id'),
                 "metrics_data": json.dumps(metrics_data),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "user_id": self.execution_context.get('user_id')
             }
             
@@ -375,7 +375,7 @@ class EnhancedTextProcessor(SandboxAsyncProcessor):
         """Process text data with enhanced features."""
         
         async for text_data in data:
-            start_time = datetime.utcnow()
+            start_time = time.perf_counter()
             
             # Process the text
             processed_result = await self._process_text(text_data)
@@ -399,7 +399,7 @@ class EnhancedTextProcessor(SandboxAsyncProcessor):
             )
             
             # Log metrics
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             await self.log_processing_metrics({
                 "processing_time": processing_time,
                 "input_length": len(str(text_data)),
@@ -412,19 +412,21 @@ class EnhancedTextProcessor(SandboxAsyncProcessor):
     async def _process_text(self, text: str) -> Dict[str, Any]:
         """Internal text processing logic."""
         
-        # Simple text processing example
-        processed_text = text.strip().lower()
-        word_count = len(text.split())
-        char_count = len(text)
-        
-        # Check cache for similar text
-        cache_key = f"text_hash_{hash(text)}"
+        # Check cache for similar text before doing any work
+        # Content hash is stable across processes, unlike the randomized built-in hash()
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cache_key = f"text_hash_{self.meta.get('version')}_{text_hash}"
         cached_result = await self.get_cached_data(cache_key)
         
         if cached_result:
             self.logger.info("Using cached text processing result")
             return cached_result
         
+        # Simple text processing example
+        processed_text = text.strip().lower()
+        word_count = len(text.split())
+        char_count = len(text)
+        
         # Create result
         result = {
             "processed_text": processed_text,
@@ -453,29 +455,36 @@ class EnhancedVectorProcessor(SandboxAsyncProcessor):
         'description': 'Enhanced vector processor with database storage'
     }
     
+    vector_dimensions = 384
+    
     async def process(self, data: AsyncGenerator[Any, None]) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """Generate vectors and store them in database."""
         
+        # Loop invariants, resolved once per processor run
+        dimensions = self.vector_dimensions
+        rand = random.random
+        collection_name = f"execution_{self.execution_context.get('execution_id', 'unknown')}"
+        
         async for text_chunks in data:
             vectors = []
+            # One timestamp for the whole batch rather than one per vector
+            processing_timestamp = datetime.utcnow().isoformat()
             
             for i, chunk in enumerate(text_chunks):
                 # Generate fake vector (in real implementation, use actual embedding model)
-                import random
-                vector = [random.random() for _ in range(384)]  # 384-dimensional vector
+                vector = [rand() for _ in range(dimensions)]
                 
                 vector_data = {
                     "chunk_index": i,
                     "text": chunk,
                     "vector": vector,
-                    "vector_dimensions": len(vector),
-                    "processing_timestamp": datetime.utcnow().isoformat()
+                    "vector_dimensions": dimensions,
+                    "processing_timestamp": processing_timestamp
                 }
                 
                 vectors.append(vector_data)
             
             # Store vectors in Elasticsearch
-            collection_name = f"execution_{self.execution_context.get('execution_id', 'unknown')}"
             success = await self.store_vectors(vectors, collection_name)
             
             if success and self.debug_mode:
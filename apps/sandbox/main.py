@@ -3,7 +3,7 @@ Brain_Net Sandbox FastAPI Application
 Long-lived container for executing pipeline code and providing debugging information.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -15,10 +15,12 @@ import sys
 import io
 import uuid
 import os
+import time
 from datetime import datetime
 from contextlib import redirect_stdout, redirect_stderr
 import json
 import httpx
+from itertools import islice
 
 # Configuration from environment variables
 SANDBOX_HOST = os.getenv("SANDBOX_HOST", "0.0.0.0")
@@ -29,6 +31,17 @@ MAX_CONCURRENT_EXECUTIONS = int(os.getenv("MAX_CONCURRENT_EXECUTIONS", "10"))
 DEBUG_MODE = os.getenv("DEBUG_MODE", "true").lower() == "true"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Settings are fixed at startup, so build the reported configuration once
+SANDBOX_CONFIGURATION = {
+    "host": SANDBOX_HOST,
+    "port": SANDBOX_PORT,
+    "backend_url": BACKEND_URL,
+    "execution_timeout": EXECUTION_TIMEOUT,
+    "max_concurrent_executions": MAX_CONCURRENT_EXECUTIONS,
+    "debug_mode": DEBUG_MODE,
+    "log_level": LOG_LEVEL
+}
+
 # Configure logging
 logging.basicConfig(level=getattr(logging, LOG_LEVEL.upper()))
 logger = logging.getLogger(__name__)
@@ -55,6 +68,9 @@ app.add_middleware(
 execution_results: Dict[str, Dict[str, Any]] = {}
 active_executions: Dict[str, bool] = {}
 
+# Limits how many submitted executions run at the same time
+execution_semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXECUTIONS)
+
 
 class CodeExecutionRequest(BaseModel):
     """Request model for code execution."""
@@ -103,15 +119,7 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat(),
         "active_executions": len(active_executions),
         "stored_results": len(execution_results),
-        "configuration": {
-            "host": SANDBOX_HOST,
-            "port": SANDBOX_PORT,
-            "backend_url": BACKEND_URL,
-            "execution_timeout": EXECUTION_TIMEOUT,
-            "max_concurrent_executions": MAX_CONCURRENT_EXECUTIONS,
-            "debug_mode": DEBUG_MODE,
-            "log_level": LOG_LEVEL
-        }
+        "configuration": SANDBOX_CONFIGURATION
     }
 
 
@@ -119,15 +127,7 @@ async def health_check():
 async def get_configuration():
     """Get current sandbox configuration."""
     return {
-        "sandbox_configuration": {
-            "host": SANDBOX_HOST,
-            "port": SANDBOX_PORT,
-            "backend_url": BACKEND_URL,
-            "execution_timeout": EXECUTION_TIMEOUT,
-            "max_concurrent_executions": MAX_CONCURRENT_EXECUTIONS,
-            "debug_mode": DEBUG_MODE,
-            "log_level": LOG_LEVEL
-        },
+        "sandbox_configuration": SANDBOX_CONFIGURATION,
         "runtime_info": {
             "active_executions": len(active_executions),
             "stored_results": len(execution_results),
@@ -174,16 +174,16 @@ async def get_execution_result(execution_id: str):
     if execution_id not in execution_results:
         raise HTTPException(status_code=404, detail="Execution not found")
     
-    result = execution_results[execution_id]
-    return ExecutionResult(**result)
+    # Stored results are validated once by response_model on the way out
+    return execution_results[execution_id]
 
 
 @app.get("/executions", response_model=List[ExecutionResult])
-async def list_executions(limit: int = 10, offset: int = 0):
+async def list_executions(limit: int = Query(10, ge=0), offset: int = Query(0, ge=0)):
     """List recent executions."""
-    results = list(execution_results.values())
-    results.sort(key=lambda x: x['start_time'], reverse=True)
-    return [ExecutionResult(**r) for r in results[offset:offset+limit]]
+    # Results are inserted as executions start, so newest-first is reverse insertion order
+    results = islice(reversed(execution_results.values()), offset, offset + limit)
+    return list(results)
 
 
 @app.delete("/execution/{execution_id}")
@@ -249,7 +249,14 @@ async def _execute_code_async(
     processor_id: Optional[str]
 ):
     """Execute code asynchronously with debugging information."""
+    code_future = None
+    await execution_semaphore.acquire()
     try:
+        # Cancelled while still queued: give the slot straight back
+        if not active_executions.get(execution_id, False):
+            return
+        
+        # The job stays "pending" until it holds an execution slot
         execution_results[execution_id]["status"] = "running"
         
         # Capture stdout and stderr
@@ -272,19 +279,17 @@ async def _execute_code_async(
             "exceptions": []
         }
         
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
-            # Execute code with timeout
             with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
                 # Parse and execute code
                 compiled_code = compile(code, "<sandbox>", "exec")
                 
-                # Execute with timeout
-                await asyncio.wait_for(
-                    asyncio.create_task(_run_code_sync(compiled_code, exec_globals)),
-                    timeout=timeout
-                )
+                # Execute with timeout; shield the thread's future so a timeout
+                # leaves it pending until the code really stops running
+                code_future = _run_code_sync(compiled_code, exec_globals)
+                await asyncio.wait_for(asyncio.shield(code_future), timeout=timeout)
                 
         except asyncio.TimeoutError:
             execution_results[execution_id]["status"] = "timeout"
@@ -317,9 +322,8 @@ async def _execute_code_async(
             }
             execution_results[execution_id]["debug_info"] = debug_info
         
-        end_time = datetime.utcnow()
-        execution_results[execution_id]["end_time"] = end_time.isoformat()
-        execution_results[execution_id]["execution_time"] = (end_time - start_time).total_seconds()
+        execution_results[execution_id]["end_time"] = datetime.utcnow().isoformat()
+        execution_results[execution_id]["execution_time"] = time.perf_counter() - start_time
         
     except Exception as e:
         logger.error(f"Execution error for {execution_id}: {str(e)}")
@@ -328,15 +332,23 @@ async def _execute_code_async(
         execution_results[execution_id]["end_time"] = datetime.utcnow().isoformat()
     
     finally:
+        # Threads cannot be killed, so code that outlived its timeout keeps
+        # its slot until it actually returns; MAX_CONCURRENT_EXECUTIONS then
+        # bounds running threads, not just awaited ones
+        if code_future is not None and not code_future.done():
+            code_future.add_done_callback(lambda _: execution_semaphore.release())
+        else:
+            execution_semaphore.release()
+        
         # Clean up active execution
         if execution_id in active_executions:
             del active_executions[execution_id]
 
 
-async def _run_code_sync(compiled_code, exec_globals):
-    """Run compiled code synchronously in event loop."""
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, exec, compiled_code, exec_globals)
+def _run_code_sync(compiled_code, exec_globals) -> asyncio.Future:
+    """Run compiled code in the default executor and return its future."""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, exec, compiled_code, exec_globals)
 
 
 if __name__ == "__main__":
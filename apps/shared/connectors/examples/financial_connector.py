@@ -7,7 +7,6 @@ import asyncio
 import aiohttp
 from typing import AsyncIterator, List, Dict, Any
 from datetime import datetime, timedelta
-import pandas as pd
 
 from .. import BaseConnector, ConnectorConfig, DataSource, ProcessedDocument, ConnectorType, DataFormat, ProcessingCapability
 
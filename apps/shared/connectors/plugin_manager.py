@@ -5,7 +5,8 @@ Handles dynamic loading, registration, and management of data connectors
 
 import importlib
 import inspect
-from typing import Dict, List, Type, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Type, Optional, Any
 from pathlib import Path
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -19,7 +20,10 @@ class PluginRegistry:
     
     def __init__(self):
         self._connectors: Dict[str, Type[BaseConnector]] = {}
-        self._processors: Dict[ProcessingCapability, List[Type[BaseProcessor]]] = {}
+        # Insertion-ordered sets (dict keys) so the first registered processor stays preferred
+        self._processors: Dict[ProcessingCapability, Dict[Type[BaseProcessor], None]] = {}
+        self._processor_capabilities: Dict[Type[BaseProcessor], ProcessingCapability] = {}
+        self._processor_counts: Optional[Mapping[ProcessingCapability, int]] = None
         self._configs: Dict[str, ConnectorConfig] = {}
         
     def register_connector(self, name: str, connector_class: Type[BaseConnector]):
@@ -37,9 +41,21 @@ class PluginRegistry:
         temp_instance = processor_class({})
         capability = temp_instance.get_capability()
         
-        if capability not in self._processors:
-            self._processors[capability] = []
-        self._processors[capability].append(processor_class)
+        self._processors.setdefault(capability, {})[processor_class] = None
+        self._processor_capabilities[processor_class] = capability
+        self._processor_counts = None
+        
+    def unregister_processor(self, processor_class: Type[BaseProcessor]):
+        """Unregister a processor class."""
+        capability = self._processor_capabilities.pop(processor_class, None)
+        if capability is None:
+            return
+        
+        processors = self._processors[capability]
+        processors.pop(processor_class, None)
+        if not processors:
+            del self._processors[capability]
+        self._processor_counts = None
         
     def get_connector(self, name: str) -> Optional[Type[BaseConnector]]:
         """Get a connector class by name."""
@@ -47,15 +63,20 @@ class PluginRegistry:
         
     def get_processors(self, capability: ProcessingCapability) -> List[Type[BaseProcessor]]:
         """Get all processors for a specific capability."""
-        return self._processors.get(capability, [])
+        return list(self._processors.get(capability, ()))
         
     def list_connectors(self) -> List[str]:
         """List all registered connector names."""
         return list(self._connectors.keys())
         
-    def list_processors(self) -> Dict[ProcessingCapability, int]:
+    def list_processors(self) -> Mapping[ProcessingCapability, int]:
         """List all registered processors by capability."""
-        return {cap: len(processors) for cap, processors in self._processors.items()}
+        # Cached until the next register/unregister; callers get a read-only view
+        if self._processor_counts is None:
+            self._processor_counts = MappingProxyType(
+                {cap: len(processors) for cap, processors in self._processors.items()}
+            )
+        return self._processor_counts
 
 
 class PluginManager:
@@ -127,24 +148,37 @@ class PluginManager:
             await self.active_connectors[name].disconnect()
             del self.active_connectors[name]
             
-    async def process_with_pipeline(self, document, pipeline_config: List[str]) -> Any:
-        """Process a document through a pipeline of processors."""
-        current_doc = document
+    def prepare_pipeline(self, pipeline_config: List[str]) -> List[BaseProcessor]:
+        """Resolve a pipeline config to processor instances once, for reuse across documents."""
+        processors = []
         
         for processor_name in pipeline_config:
             capability = ProcessingCapability(processor_name)
-            processors = self.registry.get_processors(capability)
+            processor_classes = self.registry.get_processors(capability)
             
-            if not processors:
+            if not processor_classes:
                 continue
                 
             # Use the first available processor for this capability
-            processor_class = processors[0]
-            processor = processor_class(config={})
+            processor_class = processor_classes[0]
+            processors.append(processor_class(config={}))
+            
+        return processors
+        
+    async def process_with_prepared_pipeline(self, document, processors: List[BaseProcessor]) -> Any:
+        """Process a document through processors returned by prepare_pipeline."""
+        current_doc = document
+        
+        for processor in processors:
             current_doc = await processor.process(current_doc)
             
         return current_doc
         
+    async def process_with_pipeline(self, document, pipeline_config: List[str]) -> Any:
+        """Process a document through a pipeline of processors."""
+        processors = self.prepare_pipeline(pipeline_config)
+        return await self.process_with_prepared_pipeline(document, processors)
+        
     async def shutdown(self):
         """Shutdown all active connectors."""
         for connector in self.active_connectors.values():
@@ -3,8 +3,7 @@ Database configuration for SQLModel.
 """
 
 from sqlmodel import SQLModel, create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from typing import AsyncGenerator
 
 
@@ -15,9 +14,26 @@ def create_db_engine(database_url: str, echo: bool = False):
 
 def create_async_db_engine(database_url: str, echo: bool = False, **kwargs):
     """Create async SQLAlchemy engine for SQLModel."""
+    if database_url.startswith("postgresql"):
+        # Size the pool for concurrent async workers and drop dead connections before use
+        kwargs.setdefault("pool_size", 20)
+        kwargs.setdefault("max_overflow", 40)
+        kwargs.setdefault("pool_pre_ping", True)
+        kwargs.setdefault("pool_recycle", 1800)
+    if database_url.startswith("postgresql+asyncpg"):
+        # Pin the session TimeZone so server-side rendering and date functions
+        # (now()::date, date_trunc) use UTC; asyncpg already decodes timestamptz as UTC
+        connect_args = kwargs.setdefault("connect_args", {})
+        connect_args.setdefault("server_settings", {}).setdefault("timezone", "UTC")
     return create_async_engine(database_url, echo=echo, **kwargs)
 
 
+def create_async_session_factory(engine) -> async_sessionmaker:
+    """Create async session factory bound to a pooled engine."""
+    # Keep loaded objects usable after commit without a refetch per attribute
+    return async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
 def create_tables(engine):
     """Create all tables defined in SQLModel models."""
     SQLModel.metadata.create_all(engine)
@@ -5,10 +5,10 @@ Shared models for the Brain_Net application.
 from .user import User, UserBase, UserCreate, UserUpdate, UserRead
 from .file import UserFile, UserFileRead, UserFileList
 from .processor import (
-    UserProcessor, UserPipeline, PipelineExecution, UserProcessorCreate, 
-    UserPipelineCreate, ProcessorExecutionRequest, UserProcessorRead, UserPipelineRead, 
+    UserProcessor, ProcessorCapability, UserPipeline, PipelineExecution, UserProcessorCreate, 
+    UserPipelineCreate, ProcessorStep, ProcessorExecutionRequest, UserProcessorRead, UserPipelineRead, 
     PipelineExecutionRead, UserProcessorList, UserPipelineList, PipelineExecutionList, 
-    ProcessorStatus, ProcessorType, PipelineStatus
+    ProcessorStatus, ProcessorType, ProcessorCapabilityKind, PipelineStatus
 )
 
 __all__ = [
@@ -21,10 +21,12 @@ __all__ = [
     "UserFileRead", 
     "UserFileList",
     "UserProcessor",
+    "ProcessorCapability",
     "UserPipeline",
     "PipelineExecution",
     "UserProcessorCreate",
     "UserPipelineCreate",
+    "ProcessorStep",
     "ProcessorExecutionRequest",
     "UserProcessorRead",
     "UserPipelineRead",
@@ -34,5 +36,6 @@ __all__ = [
     "PipelineExecutionList",
     "ProcessorStatus",
     "ProcessorType",
+    "ProcessorCapabilityKind",
     "PipelineStatus"
 ] 
\ No newline at end of file
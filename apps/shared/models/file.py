@@ -4,7 +4,8 @@ File models for tracking file uploads and ownership.
 
 from datetime import datetime
 from typing import Optional
-from sqlmodel import SQLModel, Field, Column, DateTime, ForeignKey
+from pydantic import ConfigDict
+from sqlmodel import SQLModel, Field, Column, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 
 
@@ -13,8 +14,8 @@ class UserFile(SQLModel, table=True):
     __tablename__ = "user_files"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
-    file_hash: str = Field(index=True, max_length=64)
+    user_id: int = Field(foreign_key="users.id")
+    file_hash: str = Field(max_length=64)
     original_filename: str = Field(max_length=255)
     file_size: int
     content_type: str = Field(max_length=255)
@@ -26,12 +27,15 @@ class UserFile(SQLModel, table=True):
     
     # Composite index for efficient lookups
     __table_args__ = (
-        {"sqlite_autoincrement": True}
+        Index("ix_user_files_user_hash", "user_id", "file_hash", unique=True),
+        {"sqlite_autoincrement": True},
     )
 
 
 class UserFileRead(SQLModel):
     """Schema for reading user file information."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     file_hash: str
     original_filename: str
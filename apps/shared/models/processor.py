@@ -3,12 +3,30 @@ Processor and Pipeline models for the Brain_Net application.
 """
 
 from datetime import datetime
+from uuid import UUID, uuid4
 from typing import Optional, Dict, Any, List
 from enum import Enum
-from sqlmodel import SQLModel, Field, Column, DateTime, JSON, Text, Relationship
+from pydantic import ConfigDict, TypeAdapter
+from sqlmodel import SQLModel, Field, Column, DateTime, JSON, Text, Relationship, Index
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PG_UUID
+from sqlalchemy import Computed, Table, text
+from sqlalchemy.orm import declared_attr, deferred
 from sqlalchemy.sql import func
 
 
+def _deferred_columns(table: Table, *names: str) -> Dict[str, Any]:
+    """Mapper properties for heavy columns, loaded on first access or up front via undefer()."""
+    return {name: deferred(table.c[name]) for name in names}
+
+
+def _search_vector_column() -> Column:
+    """Stored full-text search vector over name and description."""
+    return Column(TSVECTOR, Computed(
+        "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))",
+        persisted=True
+    ))
+
+
 class ProcessorStatus(str, Enum):
     """Status of a processor."""
     ACTIVE = "active"
@@ -24,6 +42,13 @@ class ProcessorType(str, Enum):
     CUSTOM = "custom"
 
 
+class ProcessorCapabilityKind(str, Enum):
+    """Kind of value a processor capability row describes."""
+    INPUT = "input"
+    OUTPUT = "output"
+    CAPABILITY = "capability"
+
+
 class PipelineStatus(str, Enum):
     """Status of a pipeline."""
     ACTIVE = "active"
@@ -33,6 +58,10 @@ class PipelineStatus(str, Enum):
     FAILED = "failed"
 
 
+# List-form fields of UserProcessorCreate that are stored as ProcessorCapability rows
+_CAPABILITY_LIST_FIELDS = ("input_types", "output_types", "processing_capabilities")
+
+
 class UserProcessor(SQLModel, table=True):
     """Model for user-defined processors."""
     __tablename__ = "user_processors"
@@ -49,10 +78,11 @@ class UserProcessor(SQLModel, table=True):
     config_schema: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))  # JSON schema for configuration
     default_config: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))  # Default configuration
     
-    # Processing metadata
-    input_types: List[str] = Field(default=[], sa_column=Column(JSON))  # Supported input types
-    output_types: List[str] = Field(default=[], sa_column=Column(JSON))  # Supported output types
-    processing_capabilities: List[str] = Field(default=[], sa_column=Column(JSON))  # What this processor can do
+    # Processing metadata (supported input/output types and capabilities)
+    capabilities: List["ProcessorCapability"] = Relationship(
+        back_populates="processor",
+        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete-orphan"}
+    )
     
     # Usage tracking
     usage_count: int = Field(default=0)
@@ -72,7 +102,107 @@ class UserProcessor(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True), onupdate=func.now())
     )
     
+    # Full-text search over name/description, maintained by the database
+    search_vector: Optional[str] = Field(default=None, sa_column=_search_vector_column())
+    
     # Note: Pipelines reference processors via processor_sequence JSON field, not direct relationship
+    
+    __table_args__ = (
+        Index("ix_processor_fts", "search_vector", postgresql_using="gin"),
+    )
+    
+    @declared_attr
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        # processor_code can be tens of KB and list views never show it;
+        # search_vector is only used inside queries
+        return {"properties": _deferred_columns(cls.__table__, "processor_code", "search_vector")}
+    
+    def __init__(self, **data: Any):
+        # Accept the list form used by UserProcessorCreate and store it as capability rows
+        capability_lists = {name: data.pop(name, None) or [] for name in _CAPABILITY_LIST_FIELDS}
+        super().__init__(**data)
+        self._add_capability_lists(capability_lists)
+    
+    @classmethod
+    def model_validate(
+        cls,
+        obj: Any,
+        *,
+        strict: Optional[bool] = None,
+        from_attributes: Optional[bool] = None,
+        context: Optional[Dict[str, Any]] = None,
+        update: Optional[Dict[str, Any]] = None,
+    ) -> "UserProcessor":
+        """Validate into a processor, keeping the capability lists __init__ accepts."""
+        # Table models are validated without going through __init__, so convert the lists here too
+        capability_lists: Dict[str, List[str]] = {name: [] for name in _CAPABILITY_LIST_FIELDS}
+        if not isinstance(obj, UserProcessor):
+            source = {**(obj if isinstance(obj, dict) else {}), **(update or {})}
+            capability_lists = {
+                name: (source[name] if name in source else getattr(obj, name, None)) or []
+                for name in _CAPABILITY_LIST_FIELDS
+            }
+        processor = super().model_validate(
+            obj, strict=strict, from_attributes=from_attributes, context=context, update=update
+        )
+        processor._add_capability_lists(capability_lists)
+        return processor
+    
+    def _add_capability_lists(self, capability_lists: Dict[str, List[str]]) -> None:
+        """Append capability rows built from the list form."""
+        if any(capability_lists.values()):
+            self.capabilities = [*self.capabilities, *ProcessorCapability.from_lists(**capability_lists)]
+    
+    def _capability_values(self, kind: ProcessorCapabilityKind) -> List[str]:
+        """Get capability values of one kind, in insertion order."""
+        return [capability.value for capability in self.capabilities if capability.kind == kind]
+    
+    @property
+    def input_types(self) -> List[str]:
+        """Supported input types."""
+        return self._capability_values(ProcessorCapabilityKind.INPUT)
+    
+    @property
+    def output_types(self) -> List[str]:
+        """Supported output types."""
+        return self._capability_values(ProcessorCapabilityKind.OUTPUT)
+    
+    @property
+    def processing_capabilities(self) -> List[str]:
+        """What this processor can do."""
+        return self._capability_values(ProcessorCapabilityKind.CAPABILITY)
+
+
+class ProcessorCapability(SQLModel, table=True):
+    """Model for processor input types, output types and capabilities."""
+    __tablename__ = "processor_capabilities"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    processor_id: int = Field(foreign_key="user_processors.id", index=True)
+    kind: ProcessorCapabilityKind
+    value: str = Field(max_length=255, index=True)
+    
+    # Relationships
+    processor: UserProcessor = Relationship(back_populates="capabilities")
+    
+    # Composite index for "processors supporting X" lookups
+    __table_args__ = (
+        Index("ix_cap_kind_value", "kind", "value"),
+    )
+    
+    @classmethod
+    def from_lists(cls, input_types: List[str], output_types: List[str],
+                   processing_capabilities: List[str]) -> List["ProcessorCapability"]:
+        """Build capability rows from the list form used by the API schemas."""
+        return [
+            cls(kind=kind, value=value)
+            for kind, values in (
+                (ProcessorCapabilityKind.INPUT, input_types),
+                (ProcessorCapabilityKind.OUTPUT, output_types),
+                (ProcessorCapabilityKind.CAPABILITY, processing_capabilities),
+            )
+            for value in values
+        ]
 
 
 class UserPipeline(SQLModel, table=True):
@@ -86,7 +216,7 @@ class UserPipeline(SQLModel, table=True):
     status: PipelineStatus = Field(default=PipelineStatus.ACTIVE)
     
     # Pipeline configuration
-    processor_sequence: List[Dict[str, Any]] = Field(sa_column=Column(JSON))  # Ordered list of processor configs
+    processor_sequence: List[Dict[str, Any]] = Field(sa_column=Column(JSONB))  # Ordered list of processor configs
     global_config: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))  # Global pipeline settings
     
     # Execution metadata
@@ -97,6 +227,9 @@ class UserPipeline(SQLModel, table=True):
     # Usage tracking
     execution_count: int = Field(default=0)
     last_executed: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    # Running total in seconds so the average updates in O(1). Existing rows must be
+    # backfilled with coalesce(average_execution_time, 0) * execution_count, not 0
+    sum_execution_time: float = Field(default=0.0)
     average_execution_time: Optional[float] = Field(default=None)  # in seconds
     
     # Version control
@@ -113,9 +246,27 @@ class UserPipeline(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True), onupdate=func.now())
     )
     
+    # Full-text search over name/description, maintained by the database
+    search_vector: Optional[str] = Field(default=None, sa_column=_search_vector_column())
+    
     # Note: Processors are referenced via processor_sequence JSON field, not direct relationship
     # Relationships
-    executions: List["PipelineExecution"] = Relationship(back_populates="pipeline")
+    # Never lazy-loaded: use selectinload() so listing pipelines stays a fixed number of queries
+    executions: List["PipelineExecution"] = Relationship(
+        back_populates="pipeline",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    
+    # GIN indexes for "pipelines using processor X" containment and text search
+    __table_args__ = (
+        Index("ix_pipeline_proc_seq_gin", "processor_sequence", postgresql_using="gin"),
+        Index("ix_pipeline_fts", "search_vector", postgresql_using="gin"),
+    )
+    
+    @declared_attr
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        # search_vector is only used inside queries
+        return {"properties": _deferred_columns(cls.__table__, "search_vector")}
 
 
 class PipelineExecution(SQLModel, table=True):
@@ -123,12 +274,15 @@ class PipelineExecution(SQLModel, table=True):
     __tablename__ = "pipeline_executions"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    pipeline_id: int = Field(foreign_key="user_pipelines.id", index=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    pipeline_id: int = Field(foreign_key="user_pipelines.id")
+    user_id: int = Field(foreign_key="users.id")
     file_hash: str = Field(index=True, max_length=64)  # File being processed
     
     # Execution details
-    execution_id: str = Field(max_length=100, unique=True, index=True)  # Unique execution identifier
+    execution_id: UUID = Field(
+        default_factory=uuid4,
+        sa_column=Column(PG_UUID(as_uuid=True), unique=True, index=True, nullable=False)
+    )  # Unique execution identifier, stored as a native 16-byte uuid
     status: PipelineStatus = Field(default=PipelineStatus.RUNNING)
     
     # Timing
@@ -137,12 +291,12 @@ class PipelineExecution(SQLModel, table=True):
     execution_time: Optional[float] = Field(default=None)  # Total execution time in seconds
     
     # Results and metadata
-    result_data: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))  # Final processed data
-    processor_outputs: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))  # Individual processor outputs
+    result_data: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))  # Final processed data
+    processor_outputs: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))  # Individual processor outputs
     error_details: Optional[str] = Field(default=None, sa_column=Column(Text))  # Error information if failed
     
     # Configuration used
-    pipeline_config_snapshot: Dict[str, Any] = Field(sa_column=Column(JSON))  # Snapshot of pipeline config at execution time
+    pipeline_config_snapshot: Dict[str, Any] = Field(sa_column=Column(JSONB))  # Snapshot of pipeline config at execution time
     
     # Metadata storage hints for future integration
     storage_path: Optional[str] = Field(default=None, max_length=500)  # Path where processed data is stored
@@ -154,12 +308,49 @@ class PipelineExecution(SQLModel, table=True):
     )
     
     # Relationships
-    pipeline: UserPipeline = Relationship(back_populates="executions")
+    pipeline: UserPipeline = Relationship(
+        back_populates="executions",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    
+    # Covering indexes for "recent executions" timelines, newest first with never-started
+    # rows last; their left prefixes also serve plain user_id / pipeline_id lookups
+    __table_args__ = (
+        Index("ix_exec_user_started", "user_id", text("started_at DESC NULLS LAST"),
+              postgresql_include=["status", "execution_time"]),
+        Index("ix_exec_pipeline_started", "pipeline_id", text("started_at DESC NULLS LAST"),
+              postgresql_include=["status", "execution_time"]),
+        # Small partial index for "active executions"; enum columns store member names
+        Index("ix_exec_running", "id", postgresql_where=text("status = 'RUNNING'")),
+    )
+    
+    @declared_attr
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        # Result blobs are only needed when a single execution is inspected
+        return {"properties": _deferred_columns(
+            cls.__table__,
+            "result_data", "processor_outputs", "pipeline_config_snapshot"
+        )}
+
+
+class ProcessorStep(SQLModel):
+    """Schema for one step of a pipeline's processor_sequence."""
+    model_config = ConfigDict(frozen=True)
+    
+    processor_id: int
+    config: Dict[str, Any] = {}
+    order: Optional[int] = None
+
+
+# Validates stored processor_sequence JSON in one call; use dump_python(..., mode="json") to store
+processor_sequence_adapter = TypeAdapter(List[ProcessorStep])
 
 
 # Read schemas for API responses
 class UserProcessorRead(SQLModel):
     """Schema for reading processor information."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     name: str
     description: Optional[str]
@@ -177,11 +368,13 @@ class UserProcessorRead(SQLModel):
 
 class UserPipelineRead(SQLModel):
     """Schema for reading pipeline information."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     name: str
     description: Optional[str]
     status: PipelineStatus
-    processor_sequence: List[Dict[str, Any]]
+    processor_sequence: List[ProcessorStep]
     execution_count: int
     version: str
     is_template: bool
@@ -191,10 +384,12 @@ class UserPipelineRead(SQLModel):
 
 class PipelineExecutionRead(SQLModel):
     """Schema for reading pipeline execution information."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     pipeline_id: int
     file_hash: str
-    execution_id: str
+    execution_id: UUID
     status: PipelineStatus
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
@@ -223,7 +418,7 @@ class UserPipelineCreate(SQLModel):
     """Schema for creating a new pipeline."""
     name: str
     description: Optional[str] = None
-    processor_sequence: List[Dict[str, Any]]
+    processor_sequence: List[ProcessorStep]
     global_config: Optional[Dict[str, Any]] = None
     parallel_execution: bool = False
     max_retry_attempts: int = 3
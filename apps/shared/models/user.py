@@ -4,6 +4,7 @@ User models using SQLModel for database tables and API schemas.
 
 from datetime import datetime
 from typing import Optional
+from pydantic import ConfigDict
 from sqlmodel import SQLModel, Field, Column, DateTime
 from sqlalchemy.sql import func
 
@@ -35,17 +36,7 @@ class User(UserBase, table=True):
     
     def dict(self):
         """Convert user to dictionary (excluding password) for compatibility."""
-        return {
-            "id": self.id,
-            "email": self.email,
-            "username": self.username,
-            "full_name": self.full_name,
-            "is_active": self.is_active,
-            "is_superuser": self.is_superuser,
-            "avatar_url": self.avatar_url,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return UserRead.model_validate(self).model_dump(mode="json")
 
 
 class UserCreate(UserBase):
@@ -66,6 +57,8 @@ class UserUpdate(SQLModel):
 
 class UserRead(UserBase):
     """Schema for reading a user (public fields only)."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None 
\ No newline at end of file
@@ -2,10 +2,15 @@
 Shared schemas for Brain_Net applications
 """
 
-from .upload import FileUploadResponse, FileInfoResponse, FileProcessRequest
+from .upload import (
+    FileUploadResponse, FileInfoResponse, FileProcessRequest,
+    UserFileResponse, UserFileListResponse
+)
 
 __all__ = [
     "FileUploadResponse",
-    "FileInfoResponse", 
-    "FileProcessRequest"
-] 
\ No newline at end of file
+    "FileInfoResponse",
+    "FileProcessRequest",
+    "UserFileResponse",
+    "UserFileListResponse"
+]
@@ -3,12 +3,14 @@ Schemas for file upload functionality
 """
 
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from datetime import datetime
 
 
 class FileUploadResponse(BaseModel):
     """Response schema for file upload."""
+    model_config = ConfigDict(frozen=True)
+    
     status: str  # "uploaded" or "already_uploaded"
     message: str
     file_hash: str
@@ -19,6 +21,8 @@ class FileUploadResponse(BaseModel):
 
 class FileInfoResponse(BaseModel):
     """Response schema for file information."""
+    model_config = ConfigDict(frozen=True)
+    
     file_hash: str
     original_filename: str
     file_size: int
@@ -35,6 +39,8 @@ class FileProcessRequest(BaseModel):
 
 class UserFileResponse(BaseModel):
     """Response schema for user file information."""
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     file_hash: str
     original_filename: str
@@ -45,5 +51,11 @@ class UserFileResponse(BaseModel):
 
 class UserFileListResponse(BaseModel):
     """Response schema for listing user files."""
+    model_config = ConfigDict(frozen=True)
+    
     files: List[UserFileResponse]
-    total_count: int 
\ No newline at end of file
+    total_count: int
+
+
+# Built once at import so list endpoints reuse the compiled validator
+user_file_list_adapter = TypeAdapter(List[UserFileResponse])
@@ -0,0 +1,44 @@
+"""
+Tests for the processor models
+Run from the repository root: python -m pytest tests
+"""
+
+from apps.shared.models import UserProcessor, UserProcessorCreate
+
+
+def _processor_create() -> UserProcessorCreate:
+    return UserProcessorCreate(
+        name="Smart Text Chunker",
+        processor_code="class Chunker: ...",
+        input_types=["str", "text"],
+        output_types=["chunks"],
+        processing_capabilities=["text_chunking"]
+    )
+
+
+def test_constructor_stores_capability_lists():
+    processor = UserProcessor(user_id=1, **_processor_create().model_dump())
+
+    assert processor.input_types == ["str", "text"]
+    assert processor.output_types == ["chunks"]
+    assert processor.processing_capabilities == ["text_chunking"]
+
+
+def test_model_validate_stores_capability_lists():
+    processor = UserProcessor.model_validate(_processor_create(), update={"user_id": 1})
+
+    assert processor.user_id == 1
+    assert processor.input_types == ["str", "text"]
+    assert processor.output_types == ["chunks"]
+    assert processor.processing_capabilities == ["text_chunking"]
+    assert len(processor.capabilities) == 4
+
+
+def test_model_validate_update_overrides_capability_lists():
+    processor = UserProcessor.model_validate(
+        _processor_create().model_dump(),
+        update={"user_id": 1, "output_types": ["List[str]"]}
+    )
+
+    assert processor.input_types == ["str", "text"]
+    assert processor.output_types == ["List[str]"]